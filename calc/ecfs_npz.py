@@ -0,0 +1,20 @@
+"""
+Convert the gzipped JSON files with ECF values into NumPy .npz files.
+
+Arrays are stored in a single level, using as names the nested
+keys of the JSON files joined with "/", e.g. "PN/e2/ff/3/Medium".
+Values without and with Galactic absorption correction are stacked
+along the first axis of each array.
+"""
+from pathlib import Path
+
+import numpy as np
+
+from ecfxa.utils import read_json_ecfs
+
+
+data_path = Path("..", "src", "ecfxa", "data")
+
+for mission in ("erosita", "swift", "xmm"):
+    ecf_values = read_json_ecfs(data_path, mission)
+    np.savez_compressed(data_path / f"{mission}_ecfs.npz", **ecf_values)
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -39,149 +40,83 @@ kwargs_arfgen_onaxis = {
 }
 
 
-# Generate ARFs for pn, mos1 and mos2 for two different spectra, assuming that the observation was done today
-ccf_path = data_path / "nowccf.cif"
-# make_ccf(ccf_path)
-os.environ["SAS_CCF"] = str(ccf_path.resolve())
-
-# Following http://xmm-tools.cosmos.esa.int/external/sas/current/doc/arfgen/node11.html
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_PNS13.arf",
-    spectrumset=data_path / "PNS13SRSPEChz403409.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_PNS16.arf",
-    spectrumset=data_path / "PNS16SRSPEChz421525.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_M1S13.arf",
-    spectrumset=data_path / "M1S13SRSPEChz403409.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_M1S16.arf",
-    spectrumset=data_path / "M1S16SRSPEChz421525.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_M2S13.arf",
-    spectrumset=data_path / "M2S13SRSPEChz403409.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_M2S16.arf",
-    spectrumset=data_path / "M2S16SRSPEChz421525.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-
-
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_PNS13_medium.arf",
-    spectrumset=data_path / "PNS13SRSPEChz403409_medium.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_PNS13_thick.arf",
-    spectrumset=data_path / "PNS13SRSPEChz403409_thick.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_M1S13_medium.arf",
-    spectrumset=data_path / "M1S13SRSPEChz403409_medium.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_M1S13_thick.arf",
-    spectrumset=data_path / "M1S13SRSPEChz403409_thick.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_M2S13_medium.arf",
-    spectrumset=data_path / "M2S13SRSPEChz403409_medium.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_M2S13_thick.arf",
-    spectrumset=data_path / "M2S13SRSPEChz403409_thick.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-
-
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_PNS13_singles.arf",
-    spectrumset=data_path / "PNS13SRSPEChz403409_singles.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_PNS13_medium_singles.arf",
-    spectrumset=data_path / "PNS13SRSPEChz403409_medium_singles.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "now_PNS13_thick_singles.arf",
-    spectrumset=data_path / "PNS13SRSPEChz403409_thick_singles.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-
-
-# Generate ARFs for pn, mos1 and mos2 for two different spectra, assuming that the observation was done in 2001
-ccf_path = data_path / "2001_ccf.cif"
-# make_ccf(ccf_path, date="2001-01-01")
-os.environ["SAS_CCF"] = str(ccf_path.resolve())
-
-# Following http://xmm-tools.cosmos.esa.int/external/sas/current/doc/arfgen/node11.html
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "2001_PNS13.arf",
-    spectrumset=data_path / "PNS13SRSPEChz403409.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "2001_PNS16.arf",
-    spectrumset=data_path / "PNS16SRSPEChz421525.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "2001_M1S13.arf",
-    spectrumset=data_path / "M1S13SRSPEChz403409.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "2001_M1S16.arf",
-    spectrumset=data_path / "M1S16SRSPEChz421525.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "2001_M2S13.arf",
-    spectrumset=data_path / "M2S13SRSPEChz403409.FTZ",
-    **kwargs_arfgen_onaxis,
-)
-pxsas.run(
-    "arfgen",
-    arfset=data_path / "2001_M2S16.arf",
-    spectrumset=data_path / "M2S16SRSPEChz421525.FTZ",
-    **kwargs_arfgen_onaxis,
-)
+def run_arfgen(arfset, spectrumset, ccf):
+    # Each worker process has its own environment, so setting
+    # SAS_CCF here does not race with arfgen runs using other CCFs
+    os.environ["SAS_CCF"] = str(ccf.resolve())
+
+    # Following http://xmm-tools.cosmos.esa.int/external/sas/current/doc/arfgen/node11.html
+    pxsas.run(
+        "arfgen",
+        arfset=arfset,
+        spectrumset=spectrumset,
+        **kwargs_arfgen_onaxis,
+    )
+
+
+def arfgen_jobs(prefix, ccf_path, spectra):
+    return [
+        (data_path / f"{prefix}_{arf_name}.arf", data_path / spectrum, ccf_path)
+        for arf_name, spectrum in spectra.items()
+    ]
+
+
+def main():
+    # Generate ARFs for pn, mos1 and mos2 for two different spectra, assuming that the observation was done today
+    ccf_path = data_path / "nowccf.cif"
+    # make_ccf(ccf_path)
+
+    jobs = arfgen_jobs(
+        "now",
+        ccf_path,
+        {
+            "PNS13": "PNS13SRSPEChz403409.FTZ",
+            "PNS16": "PNS16SRSPEChz421525.FTZ",
+            "M1S13": "M1S13SRSPEChz403409.FTZ",
+            "M1S16": "M1S16SRSPEChz421525.FTZ",
+            "M2S13": "M2S13SRSPEChz403409.FTZ",
+            "M2S16": "M2S16SRSPEChz421525.FTZ",
+            "PNS13_medium": "PNS13SRSPEChz403409_medium.FTZ",
+            "PNS13_thick": "PNS13SRSPEChz403409_thick.FTZ",
+            "M1S13_medium": "M1S13SRSPEChz403409_medium.FTZ",
+            "M1S13_thick": "M1S13SRSPEChz403409_thick.FTZ",
+            "M2S13_medium": "M2S13SRSPEChz403409_medium.FTZ",
+            "M2S13_thick": "M2S13SRSPEChz403409_thick.FTZ",
+            "PNS13_singles": "PNS13SRSPEChz403409_singles.FTZ",
+            "PNS13_medium_singles": "PNS13SRSPEChz403409_medium_singles.FTZ",
+            "PNS13_thick_singles": "PNS13SRSPEChz403409_thick_singles.FTZ",
+        },
+    )
+
+    # Generate ARFs for pn, mos1 and mos2 for two different spectra, assuming that the observation was done in 2001
+    ccf_path = data_path / "2001_ccf.cif"
+    # make_ccf(ccf_path, date="2001-01-01")
+
+    jobs += arfgen_jobs(
+        "2001",
+        ccf_path,
+        {
+            "PNS13": "PNS13SRSPEChz403409.FTZ",
+            "PNS16": "PNS16SRSPEChz421525.FTZ",
+            "M1S13": "M1S13SRSPEChz403409.FTZ",
+            "M1S16": "M1S16SRSPEChz421525.FTZ",
+            "M2S13": "M2S13SRSPEChz403409.FTZ",
+            "M2S16": "M2S16SRSPEChz421525.FTZ",
+        },
+    )
+
+    # arfgen runs are independent, so we can run them in parallel.
+    # A failed run is reported, but it doesn't stop the rest of the batch.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {executor.submit(run_arfgen, *job): job for job in jobs}
+
+        for future in as_completed(futures):
+            arfset = futures[future][0]
+            error = future.exception()
+
+            if error is not None:
+                print(f"arfgen failed for {arfset}: {error}")
+
+
+if __name__ == "__main__":
+    main()
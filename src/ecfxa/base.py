@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+import math
+from abc import ABC, abstractmethod
+from functools import cached_property, lru_cache
+
+import numpy as np
+from astropy import units as u
+
+from .interpolation import BilinearInterpolator
+from .utils import compile_epochs
+
+
+class ECFBase(ABC):
+    """
+    Evaluation of ECFs common to all missions.
+
+    Subclasses set the singleton holding the ECF values of the mission
+    with `_set_ecf`, and define the calibration `epochs` and the `_ecf_key`
+    property, which selects the ECF grid for the instance configuration.
+    """
+
+    # Units of the ECFs, built once instead of on every call
+    _ecf_unit = u.cm**2 / u.erg
+
+    _epoch_table = None
+
+    @property
+    @abstractmethod
+    def _ecf_key(self) -> tuple:
+        """
+        Keys selecting the ECF grid for the instance configuration.
+        """
+
+    @staticmethod
+    def _parse_nh(nh, lognh):
+        if nh is not None and lognh is not None:
+            raise ValueError("Only one of nh and lognh can be given.")
+
+        if nh is None and lognh is None:
+            nh = 3e20
+
+        # Quantities are converted to the units of the ECF grid. Incompatible
+        # units raise an error, instead of being silently stripped
+        if isinstance(nh, u.Quantity):
+            nh = nh.to_value(u.cm**-2)
+
+        if isinstance(lognh, u.Quantity):
+            lognh = lognh.to_value(u.dex(u.cm**-2))
+
+        return nh, lognh
+
+    @staticmethod
+    def _parse_gamma(gamma):
+        if isinstance(gamma, u.Quantity):
+            gamma = gamma.to_value(u.dimensionless_unscaled)
+
+        return gamma
+
+    @classmethod
+    def _compile_epochs(cls):
+        return compile_epochs(cls.epochs)
+
+    @classmethod
+    def _get_epoch_table(cls):
+        # The epochs lookup table is only built once, on first use
+        if cls._epoch_table is None:
+            cls._epoch_table = cls._compile_epochs()
+
+        return cls._epoch_table
+
+    def _set_ecf(self, ecf):
+        self._ecf = ecf
+
+        # Interpolation limits, used for clamping input values
+        self._lognh_lo = float(ecf.lognh[0])
+        self._lognh_hi = float(ecf.lognh[-1])
+        self._gamma_lo = float(ecf.gamma[0])
+        self._gamma_hi = float(ecf.gamma[-1])
+
+    @cached_property
+    def _eval_nocorr(self):
+        # Interpolators are built only when first needed, since
+        # most of the time only one of them is used
+        return _build_interpolator(type(self._ecf), self._ecf_key, abscorr=False)
+
+    @cached_property
+    def _eval_abscorr(self):
+        return _build_interpolator(type(self._ecf), self._ecf_key, abscorr=True)
+
+    def __call__(self, nh=None, gamma=1.7, abscorr=False, raw=False, lognh=None):
+        """
+        ECF for an absorbed powerlaw with Hydrogen column density `nh` (in cm-2)
+        and photon index `gamma`. If `abscorr` is True, the ECF includes the
+        correction due to absorption. If `raw` is True, the ECF is returned as
+        a plain float or array (in cm² / erg) instead of a `Quantity`, which
+        is faster for bulk flux conversions.
+
+        The column density can be given instead in logarithmic scale through
+        `lognh`, avoiding the calculation of the logarithm (e.g. for catalogues
+        with NH already in logarithmic scale). If neither `nh` nor `lognh`
+        are given, we use NH = 3×10²⁰ cm-2. `nh` can also be a `Quantity`
+        with units of column density, and `lognh` a `Dex` quantity
+        (e.g. `u.Dex(21, u.dex(u.cm**-2))`).
+
+        `nh` (or `lognh`) and `gamma` can be single values or arrays
+        (broadcastable to a common shape). Arrays are evaluated in a single
+        vectorized call (see `call_many`), which is much faster than looping
+        over sources. Values outside the tabulated grid are clamped to its limits.
+        """
+        nh, lognh = self._parse_nh(nh, lognh)
+        gamma = self._parse_gamma(gamma)
+
+        if isinstance(nh, (int, float)) and nh > 0:
+            scalar_lognh = math.log10(nh)
+        else:
+            scalar_lognh = lognh
+
+        if isinstance(scalar_lognh, (int, float)) and isinstance(gamma, (int, float)):
+            interpolator = self._eval_abscorr if abscorr else self._eval_nocorr
+
+            # Single values are evaluated with plain Python floats, which is
+            # much faster than going through NumPy. Clamping is done within
+            # the interpolator.
+            ecf = interpolator.evaluate_scalar(scalar_lognh, gamma) * 1e11
+
+            return ecf if raw else ecf << self._ecf_unit
+
+        return self.call_many(nh, gamma, abscorr, raw, lognh)
+
+    def call_many(self, nh=None, gamma=1.7, abscorr=False, raw=False, lognh=None):
+        """
+        ECFs for arrays of `nh` (or `lognh`) and `gamma` values, estimated with
+        a single vectorized evaluation. Returns a `Quantity` array (or a plain
+        array, if `raw` is True) with the broadcasted shape of the inputs.
+        """
+        nh, lognh = self._parse_nh(nh, lognh)
+        gamma = self._parse_gamma(gamma)
+        interpolator = self._eval_abscorr if abscorr else self._eval_nocorr
+
+        # Keep values of lognh and gamma between interpolation limits.
+        # lognh is clipped in place when we own it, to avoid creating
+        # more temporary arrays. log10 of a 0-d input is a NumPy scalar,
+        # which is clipped into a new value instead
+        out = None
+        if lognh is None:
+            lognh = np.log10(np.asarray(nh, dtype=np.float64))
+
+            if lognh.ndim:
+                out = lognh
+
+        lognh = np.clip(lognh, self._lognh_lo, self._lognh_hi, out=out)
+
+        gamma = np.clip(gamma, self._gamma_lo, self._gamma_hi)
+
+        # ECFs are promoted to double precision, in case the
+        # interpolation was done in single precision
+        ecf = np.multiply(interpolator(lognh, gamma), 1e11, dtype=np.float64)
+
+        return ecf if raw else ecf << self._ecf_unit
+
+
+@lru_cache(maxsize=512)
+def _build_interpolator(ecf_class, key: tuple, abscorr: bool):
+    # Interpolators only depend on these arguments, so they can be shared
+    # by all instances using the same configuration
+    ecf = ecf_class()
+    values = ecf.values[key][int(abscorr)]
+
+    return BilinearInterpolator(ecf.lognh, ecf.gamma, values)
@@ -1,18 +1,12 @@
 # -*- coding: utf-8 -*-
-import gzip
-import json
-from datetime import datetime
 from importlib import resources
 
-import numpy as np
-from astropy import units as u
-from astropy.time import Time
-from scipy.interpolate import RectBivariateSpline
-
+from .base import ECFBase
 from .singleton import SingletonMeta
+from .utils import find_epoch, load_ecfs
 
 
-class eROSITA:
+class eROSITA(ECFBase):
     """
     Energy Conversion Factors (ECFs) for the eROSITA instrument on-board the Spektr-RG mission.
 
@@ -38,6 +32,11 @@ class eROSITA:
 
     >>> ero_ecf(5e21, 1.9, abscorr=True)
     <Quantity 5.67143189e+11 cm2 / erg>
+
+    ECFs for several sources at once, using arrays of NH and photon index:
+
+    >>> ero_ecf(nh=[1e20, 5e21], gamma=[1.7, 1.9])
+    <Quantity [1.01481904e+12, 9.70689828e+11] cm2 / erg>
      
     - Show available energy bands:
     
@@ -70,15 +69,14 @@ class eROSITA:
     }
 
     epochs = {
-        "e1": ("2019-10-17", Time(datetime.now())),
+        "e1": ("2019-10-17", None),  # still ongoing
     }
 
     def __init__(self, eband="SOFT", date=None):
-        self._ecf = eROSITAECFValues()
+        self._set_ecf(eROSITAECFValues())
 
         # Attributes set in the parse method
         self._parse_args(eband, date)
-        self._interpolators = self._set_interpolators()
 
     def _parse_args(self, eband, date):
         self.eband = self._parse_eband(eband)
@@ -95,77 +93,27 @@ class eROSITA:
             epoch = "e1"
 
         else:
-            epoch = None
-            date = Time(date)
-
-            for key_epoch, values in self.epochs.items():
-                date_min = Time(values[0])
-                date_max = Time(values[1])
-
-                if date_min <= date <= date_max:
-                    epoch = key_epoch
-                    break
+            epoch = find_epoch(self._get_epoch_table(), date)
 
         if epoch is None:
             raise ValueError("Date is not compatible with the eROSITA mission.")
         
         return epoch
 
-    def _set_interpolators(self):
-        ecf_values_nocorr = np.array(
-            self._ecf.nocorr[self.epoch][self.eband]
-        )
-        ecf_values_abscorr = np.array(
-            self._ecf.abscorr[self.epoch][self.eband]
-        )
-        
-        interpolator = {
-            "nocorr": RectBivariateSpline(
-                self._ecf.nocorr["lognh"],
-                self._ecf.nocorr["gamma"],
-                ecf_values_nocorr,
-                kx=1,
-                ky=1,
-            ),
-            "abscorr": RectBivariateSpline(
-                self._ecf.abscorr["lognh"],
-                self._ecf.abscorr["gamma"],
-                ecf_values_abscorr,
-                kx=1,
-                ky=1,
-            ), 
-        }
-
-        return interpolator
-
-    def __call__(self, nh=3e20, gamma=1.7, abscorr=False):
-        lognh = np.log10(nh)
-
-        # Keep values of lognh and gamma between interpolation limits
-        lognh = np.maximum(lognh, self._ecf.nocorr["lognh"][0])
-        lognh = np.minimum(lognh, self._ecf.nocorr["lognh"][-1])
-
-        gamma = np.maximum(gamma, self._ecf.nocorr["gamma"][0])
-        gamma = np.minimum(gamma, self._ecf.nocorr["gamma"][-1])
-
-        if abscorr:
-            ecf = self._interpolators["abscorr"].ev(lognh, gamma)
-        else:
-            ecf = self._interpolators["nocorr"].ev(lognh, gamma)
-
-        return ecf * 1e11 << u.erg**-1 * u.cm**2
+    @property
+    def _ecf_key(self) -> tuple:
+        # Keys selecting the ECF grid for this configuration
+        return (self.epoch, self.eband)
 
 
 class eROSITAECFValues(metaclass=SingletonMeta):
     data_path = resources.files("ecfxa.data")
 
     def __init__(self) -> None:
-        # Values with no Galactic absorption correction
-        with resources.as_file(self.data_path / "erosita_ecfs.json.gz") as ecf_file:
-            with gzip.open(ecf_file) as fp:
-                self.nocorr = json.load(fp)
-
-        # Values taking into account Galactic absorption correction
-        with resources.as_file(self.data_path / "erosita_abscorr_ecfs.json.gz") as ecf_file:
-            with gzip.open(ecf_file) as fp:
-                self.abscorr = json.load(fp)
+        # Values with no Galactic absorption correction (index 0) and
+        # taking into account Galactic absorption correction (index 1)
+        self.values = load_ecfs(self.data_path, "erosita")
+
+        # Interpolation grid, common to all ECF values
+        self.lognh = self.values.lognh
+        self.gamma = self.values.gamma
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+import math
+from functools import lru_cache
+
+import numpy as np
+
+
+class BilinearInterpolator:
+    """
+    Bilinear interpolation of values tabulated on a regular grid.
+
+    This is equivalent to a `RectBivariateSpline` with `kx=ky=1`, but it is
+    evaluated directly with NumPy, avoiding the FITPACK machinery. Since the
+    grid is regular, the cell containing each point is found with simple
+    arithmetic instead of a binary search. As in FITPACK, points outside
+    the grid are evaluated at the closest point on the grid limits.
+
+    The bilinear polynomial of each grid cell,
+    v = c0 + c1 * tx + c2 * ty + c3 * tx * ty, with tx and ty the fractional
+    position of the point within the cell, is precomputed on initialization.
+    Evaluating a point then needs a single lookup in the coefficients table.
+
+    The coefficients are stored with the floating point precision of `values`,
+    while positions and results are always computed in double precision.
+    Single points can be evaluated with `evaluate_scalar`, which works on
+    plain Python floats and avoids the NumPy dispatch overhead.
+    """
+
+    def __init__(self, x, y, values):
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.y = np.ascontiguousarray(y, dtype=np.float64)
+        self.values = np.ascontiguousarray(values)
+
+        if self.values.dtype not in (np.float32, np.float64):
+            self.values = self.values.astype(np.float64)
+
+        if self.values.shape != (len(self.x), len(self.y)):
+            raise ValueError("Values shape doesn't match the grid.")
+
+        self._x0, self._dx = _grid_step(tuple(self.x.tolist()))
+        self._y0, self._dy = _grid_step(tuple(self.y.tolist()))
+        self._nx, self._ny = self.values.shape
+
+        # Coefficients of the bilinear polynomial for each grid cell,
+        # with shape (4, number of cells). Cells are sorted in C order.
+        v = self.values
+        self._coeffs = np.stack(
+            (
+                v[:-1, :-1],
+                v[1:, :-1] - v[:-1, :-1],
+                v[:-1, 1:] - v[:-1, :-1],
+                v[1:, 1:] - v[1:, :-1] - v[:-1, 1:] + v[:-1, :-1],
+            )
+        ).reshape(4, -1)
+
+        # Python copy of the coefficients for the scalar evaluation
+        self._cell_coeffs = list(zip(*self._coeffs.tolist()))
+
+    def __call__(self, x, y):
+        # Fractional position of the points on the grid. Operations
+        # are done in place to avoid creating temporary arrays.
+        fx = np.array(x, dtype=np.float64)
+        fx -= self._x0
+        fx /= self._dx
+
+        fy = np.array(y, dtype=np.float64)
+        fy -= self._y0
+        fy /= self._dy
+
+        # Index of the lower node of the grid cell containing each point.
+        # fmax/fmin map NaNs to a valid cell, so they propagate to the result
+        i = np.floor(fx, out=np.empty_like(fx))
+        np.fmax(i, 0, out=i)
+        np.fmin(i, self._nx - 2, out=i)
+
+        j = np.floor(fy, out=np.empty_like(fy))
+        np.fmax(j, 0, out=j)
+        np.fmin(j, self._ny - 2, out=j)
+
+        # Fractional position within the cell, clamped to the grid limits.
+        # maximum/minimum propagate NaNs, unlike fmax/fmin
+        tx = fx
+        tx -= i
+        np.maximum(tx, 0, out=tx)
+        np.minimum(tx, 1, out=tx)
+
+        ty = fy
+        ty -= j
+        np.maximum(ty, 0, out=ty)
+        np.minimum(ty, 1, out=ty)
+
+        k = i.astype(np.intp) * (self._ny - 1) + j.astype(np.intp)
+
+        c0, c1, c2, c3 = (c[k] for c in self._coeffs)
+
+        # c0 + tx * (c1 + ty * c3) + ty * c2, upcasting
+        # single precision coefficients on the first product
+        result = np.multiply(c3, ty, dtype=np.float64)
+        result += c1
+        result *= tx
+        result += np.multiply(c2, ty, dtype=np.float64)
+        result += c0
+
+        return result
+
+    def evaluate_scalar(self, x, y):
+        """
+        Evaluate the interpolator at a single point, clamping it to the grid limits.
+        """
+        if math.isnan(x) or math.isnan(y):
+            return math.nan
+
+        fx = min(max((x - self._x0) / self._dx, 0.0), self._nx - 1.0)
+        fy = min(max((y - self._y0) / self._dy, 0.0), self._ny - 1.0)
+
+        i = min(int(fx), self._nx - 2)
+        j = min(int(fy), self._ny - 2)
+
+        tx = fx - i
+        ty = fy - j
+
+        c0, c1, c2, c3 = self._cell_coeffs[i * (self._ny - 1) + j]
+
+        return c0 + tx * (c1 + ty * c3) + ty * c2
+
+
+@lru_cache(maxsize=32)
+def _grid_step(grid: tuple) -> tuple:
+    # Many interpolators share the same grid axes, so
+    # they are only validated the first time they are used
+    step = np.diff(grid)
+
+    if len(grid) < 2 or not np.allclose(step, step[0]):
+        raise ValueError("Interpolation grid must be regular.")
+
+    return float(grid[0]), float(step[0])
@@ -1,18 +1,12 @@
 # -*- coding: utf-8 -*-
-import gzip
-import json
-from datetime import datetime
 from importlib import resources
 
-import numpy as np
-from astropy import units as u
-from astropy.time import Time
-from scipy.interpolate import RectBivariateSpline
-
+from .base import ECFBase
 from .singleton import SingletonMeta
+from .utils import find_epoch, load_ecfs
 
 
-class SwiftXRT:
+class SwiftXRT(ECFBase):
     """
     Energy Conversion Factors (ECFs) for the XRT instrument on-board the Swift telescope.
 
@@ -40,6 +34,11 @@ class SwiftXRT:
 
     >>> xrtpc_ecf(5e21, 1.9, abscorr=True)
     <Quantity 3.03442833e+10 cm2 / erg>
+
+    ECFs for several sources at once, using arrays of NH and photon index:
+
+    >>> xrtpc_ecf(nh=[1e20, 5e21], gamma=[1.7, 1.9])
+    <Quantity [5.35940535e+10, 5.20816877e+10] cm2 / erg>
     
     - Show grades for the different modes:
     
@@ -77,15 +76,14 @@ class SwiftXRT:
         "e5": ("2011-01-01", "2013-01-01"),
         "e6": ("2013-01-01", "2013-12-12"),
         "e7": ("2013-12-12", "2021-01-01"),
-        "e8": ("2021-01-01", Time(datetime.now())),
+        "e8": ("2021-01-01", None),  # still ongoing
     }
 
     def __init__(self, mode, grade="0", eband="SOFT", date=None):
-        self._ecf = SWXRTECFValues()
+        self._set_ecf(SWXRTECFValues())
 
         # Attributes set in the parse method
         self._parse_args(mode, grade, eband, date)
-        self._interpolators = self._set_interpolators()
 
     def _parse_args(self, mode, grade, eband, date):
         self.mode = self._parse_mode(mode)
@@ -117,77 +115,27 @@ class SwiftXRT:
             epoch = "e6"
 
         else:
-            epoch = None
-            date = Time(date)
-
-            for key_epoch, values in self.epochs.items():
-                date_min = Time(values[0])
-                date_max = Time(values[1])
-
-                if date_min <= date <= date_max:
-                    epoch = key_epoch
-                    break
+            epoch = find_epoch(self._get_epoch_table(), date)
 
         if epoch is None:
             raise ValueError("Date is not compatible with the Swift mission.")
         
         return epoch
 
-    def _set_interpolators(self):
-        ecf_values_nocorr = np.array(
-            self._ecf.nocorr[self.mode][self.epoch][self.grade][self.eband]
-        )
-        ecf_values_abscorr = np.array(
-            self._ecf.abscorr[self.mode][self.epoch][self.grade][self.eband]
-        )
-        
-        interpolator = {
-            "nocorr": RectBivariateSpline(
-                self._ecf.nocorr["lognh"],
-                self._ecf.nocorr["gamma"],
-                ecf_values_nocorr,
-                kx=1,
-                ky=1,
-            ),
-            "abscorr": RectBivariateSpline(
-                self._ecf.abscorr["lognh"],
-                self._ecf.abscorr["gamma"],
-                ecf_values_abscorr,
-                kx=1,
-                ky=1,
-            ), 
-        }
-
-        return interpolator
-
-    def __call__(self, nh=3e20, gamma=1.7, abscorr=False):
-        lognh = np.log10(nh)
-
-        # Keep values of lognh and gamma between interpolation limits
-        lognh = np.maximum(lognh, self._ecf.nocorr["lognh"][0])
-        lognh = np.minimum(lognh, self._ecf.nocorr["lognh"][-1])
-
-        gamma = np.maximum(gamma, self._ecf.nocorr["gamma"][0])
-        gamma = np.minimum(gamma, self._ecf.nocorr["gamma"][-1])
-
-        if abscorr:
-            ecf = self._interpolators["abscorr"].ev(lognh, gamma)
-        else:
-            ecf = self._interpolators["nocorr"].ev(lognh, gamma)
-
-        return ecf * 1e11 << u.erg**-1 * u.cm**2
+    @property
+    def _ecf_key(self) -> tuple:
+        # Keys selecting the ECF grid for this configuration
+        return (self.mode, self.epoch, self.grade, self.eband)
 
 
 class SWXRTECFValues(metaclass=SingletonMeta):
     data_path = resources.files("ecfxa.data")
 
     def __init__(self) -> None:
-        # Values with no Galactic absorption correction
-        with resources.as_file(self.data_path / "swift_ecfs.json.gz") as ecf_file:
-            with gzip.open(ecf_file) as fp:
-                self.nocorr = json.load(fp)
-
-        # Values taking into account Galactic absorption correction
-        with resources.as_file(self.data_path / "swift_abscorr_ecfs.json.gz") as ecf_file:
-            with gzip.open(ecf_file) as fp:
-                self.abscorr = json.load(fp)
+        # Values with no Galactic absorption correction (index 0) and
+        # taking into account Galactic absorption correction (index 1)
+        self.values = load_ecfs(self.data_path, "swift")
+
+        # Interpolation grid, common to all ECF values
+        self.lognh = self.values.lognh
+        self.gamma = self.values.gamma
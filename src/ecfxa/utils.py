@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import os
+from importlib import resources
+from pathlib import Path
+
+import numpy as np
+from astropy.time import Time
+
+
+def numpify(ecf_values: dict) -> dict:
+    """
+    Convert in place the lists of a nested dictionary of ECF values into NumPy arrays.
+    """
+    for key, value in ecf_values.items():
+        if isinstance(value, dict):
+            numpify(value)
+
+        elif isinstance(value, list):
+            ecf_values[key] = np.ascontiguousarray(value, dtype=np.float64)
+
+    return ecf_values
+
+
+def flatten(ecf_values: dict, prefix: str = "") -> dict:
+    """
+    Flatten a nested dictionary of ECF values, joining the nested keys with "/".
+    """
+    flat = {}
+    for key, value in ecf_values.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}/"))
+        else:
+            flat[f"{prefix}{key}"] = value
+
+    return flat
+
+
+class ECFTable:
+    """
+    Flat table of ECF values, indexed by tuples with the keys that select
+    a given ECF grid, e.g. ("PN", "e2", "ff", "3", "Medium") for XMM. Each
+    grid holds the values without and with absorption correction, stacked
+    along its first axis.
+
+    `values` is a mapping of arrays whose names are these keys joined
+    with "/". Arrays are only read from it the first time they are
+    accessed, and then kept in the table converted to `dtype`.
+    """
+
+    def __init__(self, values, dtype=np.float64) -> None:
+        self._values = values
+        self._arrays = {}
+        self.dtype = dtype
+
+        # Interpolation grid
+        self.lognh = self._values["lognh"]
+        self.gamma = self._values["gamma"]
+
+    def __getitem__(self, key: tuple) -> np.ndarray:
+        array = self._arrays.get(key)
+
+        if array is None:
+            array = self._values["/".join(key)].astype(self.dtype, copy=False)
+            self._arrays[key] = array
+
+        return array
+
+
+def read_json_ecfs(data_path, mission: str) -> dict:
+    """
+    Read the ECF values for `mission` from the original gzipped JSON files.
+
+    Values without and with Galactic absorption correction are stacked
+    in a single array of shape (2, n_lognh, n_gamma) for each ECF grid.
+    Returns a flat dictionary whose keys are the nested keys of the JSON
+    files joined with "/", plus the "lognh" and "gamma" axes.
+    """
+    ecf_values = []
+    for json_file in _json_files(data_path, mission):
+        with resources.as_file(json_file) as ecf_file:
+            with gzip.open(ecf_file) as fp:
+                ecf_values.append(flatten(numpify(json.load(fp))))
+
+    nocorr, abscorr = ecf_values
+
+    return {
+        key: value if key in ("lognh", "gamma") else np.stack((value, abscorr[key]))
+        for key, value in nocorr.items()
+    }
+
+
+def _json_files(data_path, mission: str) -> tuple:
+    return (
+        data_path / f"{mission}_ecfs.json.gz",
+        data_path / f"{mission}_abscorr_ecfs.json.gz",
+    )
+
+
+def _check_npz_file(npz_file, json_files) -> None:
+    # The .npz file is built from the JSON files, so it is out of date
+    # if any of them is newer. Only checked when they are regular files.
+    if not isinstance(npz_file, Path):
+        return
+
+    npz_mtime = npz_file.stat().st_mtime
+
+    for json_file in json_files:
+        if json_file.is_file() and json_file.stat().st_mtime > npz_mtime:
+            raise RuntimeError(
+                f"{npz_file.name} is older than {json_file.name}. "
+                "Run calc/ecfs_npz.py to update it."
+            )
+
+
+def load_ecfs(data_path, mission: str) -> ECFTable:
+    """
+    Load the ECF values for `mission` stored in `data_path` (see `read_json_ecfs`).
+
+    Values are read from a NumPy .npz file if available, whose arrays
+    are only decompressed when accessed. Otherwise, they are decoded
+    from the original gzipped JSON files. A RuntimeError is raised if the
+    .npz file is older than the JSON files next to it.
+
+    ECF grids are kept in double precision. Set the environment variable
+    ECFXA_FP32=1 to keep them as float32 instead, which halves the memory
+    used by the tables, at the cost of relative differences of up to ~1e-7
+    in the results.
+    """
+    dtype = np.float32 if os.environ.get("ECFXA_FP32") == "1" else np.float64
+    npz_file = data_path / f"{mission}_ecfs.npz"
+
+    if npz_file.is_file():
+        _check_npz_file(npz_file, _json_files(data_path, mission))
+
+        # np.load opens the file from its path, so the file is closed
+        # together with the returned NpzFile
+        with resources.as_file(npz_file) as npz_path:
+            return ECFTable(np.load(npz_path), dtype)
+
+    return ECFTable(read_json_ecfs(data_path, mission), dtype)
+
+
+def compile_epochs(epochs: dict) -> tuple:
+    """
+    Convert the date limits of calibration epochs, sorted chronologically,
+    into a lookup table. Returns the epoch keys and two arrays with the
+    start and end dates of the epochs (as MJD).
+
+    Epochs still ongoing have None as end date, converted to infinity.
+    Dates are converted to UTC, the scale used by `find_epoch`.
+    """
+    keys = list(epochs)
+    starts = Time([date_min for date_min, _ in epochs.values()], scale="utc").mjd
+    ends = np.array([
+        np.inf if date_max is None else Time(date_max, scale="utc").mjd
+        for _, date_max in epochs.values()
+    ])
+
+    return keys, starts, ends
+
+
+def find_epoch(epoch_table: tuple, date) -> str | None:
+    """
+    Find the epoch containing `date` in a table produced by `compile_epochs`.
+    `date` can be anything accepted by `Time`, in any time scale. Returns
+    None if `date` is outside all epochs.
+    """
+    keys, starts, ends = epoch_table
+
+    # Epoch limits are UTC dates, so the date is compared in that scale
+    mjd = Time(date).utc.mjd
+
+    # Binary search on the start dates, so only the candidate epoch
+    # has to be checked. Dates at the boundary between two epochs
+    # belong to the earlier one.
+    idx = max(np.searchsorted(starts, mjd, side="left") - 1, 0)
+
+    if starts[idx] <= mjd <= ends[idx]:
+        return keys[idx]
+
+    return None
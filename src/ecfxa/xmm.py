@@ -1,19 +1,24 @@
 # -*- coding: utf-8 -*-
-import gzip
-import json
-from datetime import datetime
 from enum import Enum
 from importlib import resources
 
-import numpy as np
-from astropy import units as u
-from astropy.time import Time
-from scipy.interpolate import RectBivariateSpline
-
+from .base import ECFBase
 from .singleton import SingletonMeta
+from .utils import compile_epochs, find_epoch, load_ecfs
+
 
+class XMMDetector(Enum):
+    EMOS1 = ("mos1", "M1", "emos")
+    EMOS2 = ("mos2", "M2", "emos")
+    EPN = ("pn", "PN", "epn")
 
-class XMMEPIC:
+    def __init__(self, short, tag, type):
+        self.short = short
+        self.tag = tag
+        self.type = type
+
+
+class XMMEPIC(ECFBase):
     """
     Energy Conversion Factors (ECFs) for the EPIC cameras on-board the XMM-Newton observatory.
 
@@ -25,6 +30,9 @@ class XMMEPIC:
     in units of counts × cm² / erg and it is possible to include the correction due
     to absorption.
 
+    Detectors can also be given by their short names (PN, MOS1, MOS2) or tags (M1, M2),
+    case-insensitively.
+
     ECFs for the PN detector are very stable across epochs and operation modes, so it is 
     safe to use the default values. MOS detectors show higher variation across different 
     epochs, but still within ~2-3 per cent in the most extreme cases.
@@ -49,6 +57,11 @@ class XMMEPIC:
     >>> xmmpn_ecf(5e21, 1.9, abscorr=True)
     <Quantity 3.27472149e+11 cm2 / erg>
 
+    ECFs for several sources at once, using arrays of NH and photon index:
+
+    >>> xmmpn_ecf(nh=[1e20, 5e21], gamma=[1.7, 1.9])
+    <Quantity [5.80823229e+11, 5.61893163e+11] cm2 / erg>
+
     - ECF for the MOS2 camera with Thin filter at 2-10 keV for a recent observation, 
     using the default spectral parameters (NH = 3×10²⁰, Γ = 1.7):
 
@@ -76,6 +89,13 @@ class XMMEPIC:
 
     filters = ("Thin", "Medium", "Thick")
 
+    # Detector names and aliases (e.g. "EPN", "PN" or "pn"), case-insensitive
+    _detectors = {
+        name.upper(): detector
+        for detector in XMMDetector
+        for name in (detector.name, detector.short, detector.tag)
+    }
+
     ebands = {
         "1": (0.2, 0.5),
         "2": (0.5, 1.0),
@@ -96,7 +116,7 @@ class XMMEPIC:
             "e1": ("1999-12-10", "2007-01-01"),
             "e2": ("2007-01-01", "2014-01-01"),
             "e3": ("2014-01-01", "2021-01-01"),
-            "e4": ("2021-01-01", Time(datetime.now())),
+            "e4": ("2021-01-01", None),  # still ongoing
         },
         "emos": {
             "e1": ("1999-12-10", "2000-10-03"),
@@ -117,16 +137,15 @@ class XMMEPIC:
             "e16": ("2014-12-16", "2016-08-05"),
             "e17": ("2016-08-05", "2018-03-26"),
             "e18": ("2018-03-26", "2019-11-14"),
-            "e19": ("2019-11-14", Time(datetime.now())),
+            "e19": ("2019-11-14", None),  # still ongoing
         },
     }
 
     def __init__(self, detector, filter, eband="SOFT", mode=None, date=None):
-        self._ecf = XMMECFValues()
+        self._set_ecf(XMMECFValues())
 
         # Attributes set in the parse method
         self._parse_args(detector, filter, eband, mode, date)
-        self._interpolators = self._set_interpolators()
 
     def _parse_args(self, detector, filter, eband, mode, date):
         self.detector = self._parse_detector(detector)
@@ -136,12 +155,13 @@ class XMMEPIC:
         self.epoch = self._parse_date(date)
 
     def _parse_detector(self, detector: str):
-        try:
-            return XMMDetector[detector]
-        
-        except KeyError:
+        xmm_detector = self._detectors.get(str(detector).upper())
+
+        if xmm_detector is None:
             raise ValueError(f"Unknown detector: {detector}")
 
+        return xmm_detector
+
     def _parse_filter(self, filter: str) -> str:
         if filter == "Thin1" or filter == "Thin2" or filter == "Thin":
             filter = "Thin"
@@ -169,6 +189,11 @@ class XMMEPIC:
         
         return eband
         
+    @classmethod
+    def _compile_epochs(cls):
+        # Epochs are different for each detector type
+        return {dtype: compile_epochs(epochs) for dtype, epochs in cls.epochs.items()}
+
     def _parse_date(self, date) -> str:
         if date is None:
             if self.detector.type == "epn":
@@ -177,88 +202,27 @@ class XMMEPIC:
                 epoch = "e13"
 
         else:
-            date = Time(date)
-            epoch = None
-
-            for key_epoch, values in self.epochs[self.detector.type].items():
-                date_min = Time(values[0])
-                date_max = Time(values[1])
-
-                if date_min <= date <= date_max:
-                    epoch = key_epoch
-                    break
+            epoch = find_epoch(self._get_epoch_table()[self.detector.type], date)
 
         if epoch is None:
             raise ValueError("Date is not compatible with the XMM mission.")
         
         return epoch
 
-    def _set_interpolators(self):
-        ecf_values_nocorr = np.array(
-            self._ecf.nocorr[self.detector.tag][self.epoch][self.mode][self.eband][self.filter]
-        )
-        ecf_values_abscorr = np.array(
-            self._ecf.abscorr[self.detector.tag][self.epoch][self.mode][self.eband][self.filter]
-        )
-        
-        interpolator = {
-            "nocorr": RectBivariateSpline(
-                self._ecf.nocorr["lognh"],
-                self._ecf.nocorr["gamma"],
-                ecf_values_nocorr,
-                kx=1,
-                ky=1,
-            ),
-            "abscorr": RectBivariateSpline(
-                self._ecf.abscorr["lognh"],
-                self._ecf.abscorr["gamma"],
-                ecf_values_abscorr,
-                kx=1,
-                ky=1,
-            ), 
-        }
-
-        return interpolator
-
-    def __call__(self, nh=3e20, gamma=1.7, abscorr=False):
-        lognh = np.log10(nh)
-
-        # Keep values of lognh and gamma between interpolation limits
-        lognh = np.maximum(lognh, self._ecf.nocorr["lognh"][0])
-        lognh = np.minimum(lognh, self._ecf.nocorr["lognh"][-1])
-
-        gamma = np.maximum(gamma, self._ecf.nocorr["gamma"][0])
-        gamma = np.minimum(gamma, self._ecf.nocorr["gamma"][-1])
-
-        if abscorr:
-            ecf = self._interpolators["abscorr"].ev(lognh, gamma)
-        else:
-            ecf = self._interpolators["nocorr"].ev(lognh, gamma)
-
-        return ecf * 1e11 << u.erg**-1 * u.cm**2
+    @property
+    def _ecf_key(self) -> tuple:
+        # Keys selecting the ECF grid for this configuration
+        return (self.detector.tag, self.epoch, self.mode, self.eband, self.filter)
 
 
 class XMMECFValues(metaclass=SingletonMeta):
     data_path = resources.files("ecfxa.data")
 
     def __init__(self) -> None:
-        # Values with no Galactic absorption correction
-        with resources.as_file(self.data_path / "xmm_ecfs.json.gz") as ecf_file:
-            with gzip.open(ecf_file) as fp:
-                self.nocorr = json.load(fp)
-
-        # Values taking into account Galactic absorption correction
-        with resources.as_file(self.data_path / "xmm_abscorr_ecfs.json.gz") as ecf_file:
-            with gzip.open(ecf_file) as fp:
-                self.abscorr = json.load(fp)
-
+        # Values with no Galactic absorption correction (index 0) and
+        # taking into account Galactic absorption correction (index 1)
+        self.values = load_ecfs(self.data_path, "xmm")
 
-class XMMDetector(Enum):
-    EMOS1 = ("mos1", "M1", "emos")
-    EMOS2 = ("mos2", "M2", "emos")
-    EPN = ("pn", "PN", "epn")
-
-    def __init__(self, short, tag, type):
-        self.short = short
-        self.tag = tag
-        self.type = type
+        # Interpolation grid, common to all ECF values
+        self.lognh = self.values.lognh
+        self.gamma = self.values.gamma
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from astropy import units as u
+
+from ecfxa import XMMEPIC, SwiftXRT, eROSITA
+
+
+@pytest.fixture(params=[
+    lambda: XMMEPIC("EPN", "Medium", eband="3"),
+    lambda: SwiftXRT("pc", grade="04", eband="2"),
+    lambda: eROSITA(eband="P3"),
+])
+def ecf(request):
+    return request.param()
+
+
+def test_scalar_matches_array(ecf):
+    nh = np.array([1e20, 5e21, 3e22])
+    gamma = np.array([1.7, 1.9, 2.1])
+    expected = ecf(nh, gamma, raw=True)
+
+    for i in range(len(nh)):
+        assert ecf(float(nh[i]), float(gamma[i]), raw=True) == pytest.approx(
+            expected[i], rel=1e-12
+        )
+
+
+def test_zero_dim_input(ecf):
+    expected = ecf(5e21, 1.9, raw=True)
+
+    assert ecf(np.array(5e21), np.array(1.9), raw=True) == pytest.approx(expected, rel=1e-12)
+    assert ecf(np.array(1e30), 1.9, raw=True) == pytest.approx(ecf(1e30, 1.9, raw=True))
+
+
+def test_clip_keeps_input(ecf):
+    nh = np.array([1e10, 5e21, 1e30])
+    lognh = np.log10(nh)
+
+    ecf(nh, 1.9)
+    ecf(lognh=lognh, gamma=1.9)
+
+    np.testing.assert_array_equal(nh, [1e10, 5e21, 1e30])
+    np.testing.assert_array_equal(lognh, np.log10([1e10, 5e21, 1e30]))
+
+
+def test_lognh(ecf):
+    nh = np.array([1e20, 5e21])
+    np.testing.assert_allclose(
+        ecf(lognh=np.log10(nh), gamma=1.9, raw=True),
+        ecf(nh, 1.9, raw=True),
+        rtol=1e-12,
+    )
+
+
+def test_nh_quantity(ecf):
+    expected = ecf(5e21, 1.9, raw=True)
+    lognh = u.Dex(np.log10(5e21), u.dex(u.cm**-2))
+
+    assert ecf(5e25 * u.m**-2, 1.9, raw=True) == pytest.approx(expected, rel=1e-12)
+    assert ecf(5e21 * u.cm**-2, 1.9 * u.one, raw=True) == pytest.approx(expected, rel=1e-12)
+    assert ecf(lognh=lognh, gamma=1.9, raw=True) == pytest.approx(expected, rel=1e-12)
+
+    np.testing.assert_allclose(
+        ecf([5e25, 1e24] * u.m**-2, 1.9, raw=True),
+        ecf([5e21, 1e20], 1.9, raw=True),
+        rtol=1e-12,
+    )
+
+
+def test_nh_wrong_units(ecf):
+    with pytest.raises(u.UnitsError):
+        ecf(5e21 * u.s, 1.9)
+
+    with pytest.raises(u.UnitsError):
+        ecf([5e21, 1e20] * u.erg, 1.9)
+
+    with pytest.raises(u.UnitsError):
+        ecf(lognh=21.7 * u.one)
+
+
+def test_nh_and_lognh(ecf):
+    with pytest.raises(ValueError):
+        ecf(nh=5e21, lognh=21.7)
+
+
+@pytest.mark.parametrize("name, detector", [
+    ("EPN", "EPN"),
+    ("pn", "EPN"),
+    ("mos1", "EMOS1"),
+    ("M2", "EMOS2"),
+    ("emos2", "EMOS2"),
+])
+def test_xmm_detector_aliases(name, detector):
+    assert XMMEPIC(name, "Thin").detector.name == detector
+
+
+def test_xmm_unknown_detector():
+    with pytest.raises(ValueError, match="Unknown detector"):
+        XMMEPIC("MOS3", "Thin")
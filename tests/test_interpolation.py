@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import math
+
+import numpy as np
+import pytest
+from scipy.interpolate import RectBivariateSpline
+
+from ecfxa.interpolation import BilinearInterpolator
+
+
+# Same grids as the ECF tables
+LOGNH = np.linspace(19.0, 22.0, 31)
+GAMMA = np.linspace(1.4, 2.2, 9)
+
+
+@pytest.fixture(scope="module")
+def values():
+    rng = np.random.default_rng(42)
+    return rng.uniform(0.1, 10.0, size=(len(LOGNH), len(GAMMA)))
+
+
+@pytest.fixture(scope="module")
+def interpolators(values):
+    spline = RectBivariateSpline(LOGNH, GAMMA, values, kx=1, ky=1)
+    return BilinearInterpolator(LOGNH, GAMMA, values), spline
+
+
+def test_inside_grid(interpolators):
+    interpolator, spline = interpolators
+    rng = np.random.default_rng(0)
+    x = rng.uniform(19.0, 22.0, 1000)
+    y = rng.uniform(1.4, 2.2, 1000)
+
+    np.testing.assert_allclose(
+        interpolator(x, y), spline(x, y, grid=False), rtol=1e-10
+    )
+
+
+def test_grid_nodes(interpolators, values):
+    interpolator, _ = interpolators
+    x, y = np.meshgrid(LOGNH, GAMMA, indexing="ij")
+
+    np.testing.assert_allclose(interpolator(x, y), values, rtol=1e-10)
+
+
+def test_outside_grid(interpolators):
+    # Both clamp the points to the grid limits
+    interpolator, spline = interpolators
+    x = np.array([18.0, 18.5, 22.5, 23.0, 20.0, 20.0, 18.0, 23.0])
+    y = np.array([1.7, 1.0, 1.7, 2.5, 1.0, 3.0, 1.0, 3.0])
+
+    np.testing.assert_allclose(
+        interpolator(x, y), spline(x, y, grid=False), rtol=1e-10
+    )
+
+
+def test_nan(interpolators):
+    interpolator, _ = interpolators
+    result = interpolator([np.nan, 20.0, 20.0], [1.7, np.nan, 1.7])
+
+    assert np.isnan(result[:2]).all()
+    assert np.isfinite(result[2])
+
+
+def test_broadcast(interpolators):
+    interpolator, spline = interpolators
+    x = np.linspace(19.0, 22.0, 7)[:, np.newaxis]
+    y = np.linspace(1.4, 2.2, 5)
+    result = interpolator(x, y)
+
+    assert result.shape == (7, 5)
+    np.testing.assert_allclose(result, spline(x.ravel(), y), rtol=1e-10)
+
+
+def test_scalar(interpolators):
+    interpolator, spline = interpolators
+    rng = np.random.default_rng(1)
+
+    for x, y in zip(rng.uniform(19.0, 22.0, 100), rng.uniform(1.4, 2.2, 100)):
+        expected = spline(x, y, grid=False)
+        assert interpolator.evaluate_scalar(x, y) == pytest.approx(expected, rel=1e-10)
+        assert interpolator(x, y) == pytest.approx(expected, rel=1e-10)
+
+
+def test_scalar_clamps_to_grid(interpolators):
+    interpolator, spline = interpolators
+
+    assert interpolator.evaluate_scalar(18.0, 1.0) == pytest.approx(
+        spline(19.0, 1.4, grid=False), rel=1e-10
+    )
+    assert interpolator.evaluate_scalar(23.0, 3.0) == pytest.approx(
+        spline(22.0, 2.2, grid=False), rel=1e-10
+    )
+    assert math.isnan(interpolator.evaluate_scalar(math.nan, 1.7))
+
+
+def test_irregular_grid():
+    with pytest.raises(ValueError):
+        BilinearInterpolator([0.0, 1.0, 3.0], [0.0, 1.0], np.ones((3, 2)))
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import os
+
+import numpy as np
+import pytest
+from astropy import units as u
+from astropy.time import Time
+
+from ecfxa import XMMEPIC
+from ecfxa.utils import compile_epochs, find_epoch, load_ecfs
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    lognh = [20.0, 21.0]
+    gamma = [1.5, 2.0]
+    grid = [[1.0, 2.0], [3.0, 4.0]]
+
+    for name in ("test_ecfs.json.gz", "test_abscorr_ecfs.json.gz"):
+        with gzip.open(tmp_path / name, "wt") as fp:
+            json.dump({"lognh": lognh, "gamma": gamma, "A": {"1": grid}}, fp)
+
+    np.savez_compressed(
+        tmp_path / "test_ecfs.npz",
+        lognh=lognh,
+        gamma=gamma,
+        **{"A/1": np.stack((grid, grid))},
+    )
+
+    return tmp_path
+
+
+def test_load_npz(data_path):
+    table = load_ecfs(data_path, "test")
+
+    assert table[("A", "1")].shape == (2, 2, 2)
+    np.testing.assert_array_equal(table.lognh, [20.0, 21.0])
+
+
+def test_load_json_fallback(data_path):
+    os.remove(data_path / "test_ecfs.npz")
+    table = load_ecfs(data_path, "test")
+
+    np.testing.assert_array_equal(table[("A", "1")][1], [[1.0, 2.0], [3.0, 4.0]])
+
+
+def test_load_dtype(data_path, monkeypatch):
+    assert load_ecfs(data_path, "test")[("A", "1")].dtype == np.float64
+
+    monkeypatch.setenv("ECFXA_FP32", "1")
+    assert load_ecfs(data_path, "test")[("A", "1")].dtype == np.float32
+
+
+def test_outdated_npz(data_path):
+    npz_mtime = os.stat(data_path / "test_ecfs.npz").st_mtime
+    os.utime(data_path / "test_abscorr_ecfs.json.gz", (npz_mtime + 10, npz_mtime + 10))
+
+    with pytest.raises(RuntimeError, match="ecfs_npz.py"):
+        load_ecfs(data_path, "test")
+
+
+@pytest.fixture
+def epoch_table():
+    return compile_epochs({
+        "e1": ("1999-12-10", "2007-01-01"),
+        "e2": ("2007-01-01", "2014-01-01"),
+        "e3": ("2014-01-01", None),
+    })
+
+
+@pytest.mark.parametrize("date, epoch", [
+    ("1999-12-10", "e1"),
+    ("2003-05-01", "e1"),
+    ("2007-01-01", "e1"),
+    ("2007-01-01T00:00:01", "e2"),
+    ("2014-01-01", "e2"),
+    ("2020-01-01", "e3"),
+])
+def test_find_epoch(epoch_table, date, epoch):
+    assert find_epoch(epoch_table, date) == epoch
+
+
+def test_find_epoch_ongoing(epoch_table):
+    assert find_epoch(epoch_table, Time.now() + 365 * u.day) == "e3"
+    assert XMMEPIC("EPN", "Thin", date=Time.now()).epoch == "e4"
+
+
+def test_find_epoch_before_mission(epoch_table):
+    assert find_epoch(epoch_table, "1999-12-09T23:59:59") is None
+
+    with pytest.raises(ValueError):
+        XMMEPIC("EPN", "Thin", date="1999-01-01")
+
+
+def test_find_epoch_time_scale(epoch_table):
+    # 30 s after the boundary in TT, which is still 2006 in UTC
+    date = Time("2007-01-01T00:00:30", scale="tt")
+
+    assert find_epoch(epoch_table, date) == "e1"
+    assert XMMEPIC("EPN", "Thin", date=date).epoch == "e1"
+    assert XMMEPIC("EPN", "Thin", date=date.utc + 60 * u.s).epoch == "e2"
+
+
+def test_compile_epochs_time_scale():
+    start = Time("2007-01-01", scale="tt")
+    keys, starts, ends = compile_epochs({"e1": (start, start + 1 * u.day)})
+
+    assert keys == ["e1"]
+    np.testing.assert_allclose(starts, [start.utc.mjd], rtol=0, atol=1e-9)
+    np.testing.assert_allclose(ends, [start.utc.mjd + 1], rtol=0, atol=1e-9)